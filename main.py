@@ -1,10 +1,144 @@
 import csv
 import json
 import argparse
+import functools
 import re
 import html
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+import sys
+import itertools
+import os
+import shutil
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import List, Dict, Any, Optional, Tuple, Iterable, Iterator, BinaryIO, Callable
+
+try:
+	import orjson
+except ImportError:  # optional: fall back to the stdlib encoder
+	orjson = None
+
+
+# Common normalised headers -> expected key (each agrees with the substring rules in map_columns)
+_EXACT_HEADERS = {
+	"url": "job_url",
+	"job url": "job_url",
+	"job_url": "job_url",
+	"job title": "job_title",
+	"job_title": "job_title",
+	"title": "job_title",
+	"location": "location",
+	"job location": "location",
+	"city": "location",
+	"date": "posted_date",
+	"posted": "posted_date",
+	"posted date": "posted_date",
+	"posted_date": "posted_date",
+	"date posted": "posted_date",
+	"published": "posted_date",
+	"salary": "salary",
+	"salary_raw": "salary",
+	"pay": "salary",
+	"compensation": "salary",
+	"tech stack": "tech_stack",
+	"tech_stack": "tech_stack",
+	"skills": "tech_stack",
+	"technologies": "tech_stack",
+	"job description html": "job_description_html",
+	"job_description_html": "job_description_html",
+	"description_html": "job_description_html",
+}
+
+# Job boards repeat the same salary blurbs, descriptions and skill lists across many rows,
+# so the pure parsers below memoise their results per distinct input string
+_CACHE_SIZE = 8192
+
+# Rows per worker task; files that fit in a single chunk are parsed in-process
+_CHUNK_SIZE = 5000
+
+# Regex patterns are compiled once at import time and reused for every row
+_EXPERIENCE_WITH_RE = re.compile(r"experience with([^\.]+)", re.IGNORECASE)
+_TECH_SPLIT_RE = re.compile(r"[,/]| and ")
+_LEADER_RE = re.compile(r"(experience with|you should have|should have)\s+", re.IGNORECASE)
+_SALARY_WORDS = ("salary", "compensation", "package", "rate", "pay", "wage", "remuneration")
+# Characters IGNORECASE matches to letters of _SALARY_WORDS / _SALARY_HINTS that str.lower() does not map onto them
+_LOWER_MISMATCHES = ("\u017f", "\u0130", "\u0131")
+_SALARY_EXP_RE = re.compile(
+	r"(salary[^\.!\n]*|compensation[^\.!\n]*|package[^\.!\n]*|rate[^\.!\n]*|pay[^\.!\n]*|wage[^\.!\n]*|remuneration[^\.!\n]*):?\s*[^\.!\n]+",
+	re.IGNORECASE,
+)
+_MONEY_RE = re.compile(
+	r"[\$€£]\s?\d[\d,]*(?:\.\d+)?k?(?:\s*[-–]\s*[\$€£]?\s?\d[\d,]*(?:\.\d+)?k?)?(?:\s*(?:USD|GBP|EUR))?(?:\s*(?:per\s*(?:hour|day|week|month|year)|/hr|/hour|/day|/week|/month|/year|hr|hourly))?",
+	re.IGNORECASE,
+)
+_NUM_PERIOD_RE = re.compile(
+	r"\d+[\d,]*(?:\.\d+)?k?\s*(?:per\s*(?:hour|day|week|month|year)|/hr|/hour|/day|/week|/month|/year|hr\b|hourly|daily|weekly|monthly|yearly)",
+	re.IGNORECASE,
+)
+_DESCRIPTOR_RE = re.compile(r"\b(competitive|doe)\b", re.IGNORECASE)
+# Every match of the four patterns above contains at least one of these substrings:
+#   _SALARY_EXP_RE  - salary|compensation|package|rate|pay|wage|remuneration
+#   _MONEY_RE       - starts with one of $ € £
+#   _NUM_PERIOD_RE  - per\s*(hour|day|week|month|year), /hr, /hour, /day, /week, /month, /year,
+#                     hr, hourly, daily, weekly, monthly, yearly ("daily" is the only one without its unit)
+#   _DESCRIPTOR_RE  - competitive|doe
+_SALARY_HINTS = (
+	"$", "€", "£",
+	"salary", "compensation", "package", "rate", "pay", "wage", "remuneration",
+	"hr", "hour", "day", "daily", "week", "month", "year",
+	"competitive", "doe",
+)
+_CURRENCY_RE = re.compile(r"(\$|€|£|usd|gbp|eur)", re.IGNORECASE)
+# Any currency, period or salary keyword counts as a salary indicator (matched against lowercased text;
+# parse_salary re-checks currencies with _CURRENCY_RE when _LOWER_MISMATCHES characters are present)
+_SALARY_INDICATOR_RE = re.compile(
+	r"\$|€|£|usd|gbp|eur"
+	r"|per\s*(?:hour|day|week|month|year)|/hr|/hour|/day|/week|/month|/year|hr\b|hourly|daily|weekly|monthly|yearly|annum|annual|\byr\b|\bpa\b"
+	r"|\b(?:salary|compensation|package|rate|pay|wage|remuneration|base|bonus)\b"
+)
+# One alternation for every period; the named group tells which bucket matched
+_PERIOD_ALT_RE = re.compile(
+	r"(?P<hour>per\s*hour|/hour|/hr|\shr\b|hourly)"
+	r"|(?P<day>per\s*day|/day|daily|day rate|daily rate)"
+	r"|(?P<week>per\s*week|/week|weekly)"
+	r"|(?P<month>per\s*month|/month|monthly|/mo\b)"
+	r"|(?P<year>per\s*year|/year|annum|annual|yearly|\byr\b|\bpa\b|\bsalary\b|\bbase\b)"
+)
+# When several periods are mentioned, shorter units win
+_PERIOD_PRIORITY = ("hour", "day", "week", "month", "year")
+_PERIOD_LABELS = {p: p.capitalize() for p in _PERIOD_PRIORITY}
+# Relative date unit -> days (a month is approximated as 30 days)
+_REL_UNIT_DAYS = {"day": 1, "week": 7, "month": 30, "year": 365}
+# Placeholder locations, lowercased with internal whitespace collapsed
+_PLACEHOLDER_LOCS = frozenset({
+	"see job desc",
+	"see job desc.",
+	"see job description",
+	"see job description.",
+	"n/a",
+	"na",
+})
+# Matched currency token (lowercased) -> (3-letter code, symbol)
+_CUR_TABLE = {
+	"$": ("USD", "$"),
+	"usd": ("USD", "$"),
+	"£": ("GBP", "£"),
+	"gbp": ("GBP", "£"),
+	"€": ("EUR", "€"),
+	"eur": ("EUR", "€"),
+}
+_THOUSANDS_RE = re.compile(r"\d+\s*k\b")
+_NUM_PARSE_RE = re.compile(r"^(\d+(?:\.\d+)?)(k)?$", re.IGNORECASE)
+_NUM_TOKEN_RE = re.compile(r"\d+[\d,]*(?:\.\d+)?k?", re.IGNORECASE)
+_AMOUNT_LEAD_RE = re.compile(r"[\$€£]|\d")
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+_REL_DATE_RE = re.compile(r"^\s*(\d+)\s+(day|week|month|year)s?\s+ago\s*$")
+_REL_NOW_RE = re.compile(r"\b(?:hour|minute)s?\s+ago\b")
+_COMPETITIVE_RE = re.compile(r"\bcompetitive\b", re.IGNORECASE)
+# Only used for locations containing _LOWER_MISMATCHES characters; _PLACEHOLDER_LOCS covers the rest
+_PLACEHOLDER_LOC_RE = re.compile(r"(?i)\s*(see\s+job\s+desc\.?|see\s+job\s+description\.?|n/?a|na)\s*")
 
 
 def normalize_header(h: str) -> str:
@@ -16,6 +150,11 @@ def map_columns(fieldnames: List[str]) -> Dict[str, str]:
 	mapping = {}
 	for h in fieldnames:
 		nh = normalize_header(h)
+		# well-known headers resolve directly; anything else goes through the substring rules
+		key = _EXACT_HEADERS.get(nh)
+		if key is not None:
+			mapping[key] = h
+			continue
 		# job URL should not be treated as title
 		if "url" in nh:
 			mapping["job_url"] = h
@@ -43,19 +182,26 @@ def map_columns(fieldnames: List[str]) -> Dict[str, str]:
 
 
 def parse_tech_stack(s: Optional[str]) -> List[str]:
+	return list(_parse_tech_stack(s))
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _parse_tech_stack(s: Optional[str]) -> Tuple[str, ...]:
 	if not s:
-		return []
+		return ()
 	# Try to focus on the part after "experience with", which usually lists skills
-	m = re.search(r"experience with([^\.]+)", s, re.IGNORECASE)
+	m = _EXPERIENCE_WITH_RE.search(s)
 	segment = m.group(1) if m else s
-	parts = re.split(r"[,/]| and ", segment)
+	parts = _TECH_SPLIT_RE.split(segment)
 	skills: List[str] = []
 	for p in parts:
 		p = p.strip(" .;:!?\n\t")
 		if not p:
 			continue
 		# remove leading helper phrases
-		p = re.sub(r"^(experience with|you should have|should have)\s+", "", p, flags=re.IGNORECASE)
+		m_lead = _LEADER_RE.match(p)
+		if m_lead:
+			p = p[m_lead.end() :]
 		if not p:
 			continue
 		skills.append(p)
@@ -67,8 +213,37 @@ def parse_tech_stack(s: Optional[str]) -> List[str]:
 		if key in seen:
 			continue
 		seen.add(key)
-		result.append(sk)
-	return result
+		# the same skills recur across thousands of rows; share one string object per skill
+		result.append(sys.intern(sk))
+	return tuple(result)
+
+
+def _find_salary_fragment(text: str, text_lower: str) -> Optional[str]:
+	"""Plain-string equivalent of _SALARY_EXP_RE for single-line text.
+
+	Returns the text from the first salary keyword up to the end of its sentence,
+	skipping keywords that are immediately followed by a sentence terminator.
+	"""
+	pos = 0
+	while True:
+		start = -1
+		word_len = 0
+		for word in _SALARY_WORDS:
+			i = text_lower.find(word, pos)
+			if i != -1 and (start == -1 or i < start):
+				start = i
+				word_len = len(word)
+		if start == -1:
+			return None
+		word_end = start + word_len
+		end = len(text)
+		for term in ".!":
+			i = text.find(term, word_end, end)
+			if i != -1:
+				end = i
+		if end > word_end:
+			return text[start:end]
+		pos = start + 1
 
 
 def extract_salary_phrase(s: str) -> str:
@@ -80,35 +255,37 @@ def extract_salary_phrase(s: str) -> str:
 	if len(text) <= 120:
 		return text
 
+	# Cheap substring pre-check: if none of the regexes below could match, skip them all.
+	# IGNORECASE matches a few characters to keyword letters that str.lower() doesn't map
+	# onto them, so texts containing those always go through the regexes.
+	text_lower = text.lower()
+	has_mismatches = any(c in text for c in _LOWER_MISMATCHES)
+	if not has_mismatches and not any(k in text_lower for k in _SALARY_HINTS):
+		return ""
+
 	# Look for sentences/fragments mentioning salary-related words
-	m = re.search(
-		r"(salary[^\.!\n]*|compensation[^\.!\n]*|package[^\.!\n]*|rate[^\.!\n]*|pay[^\.!\n]*|wage[^\.!\n]*|remuneration[^\.!\n]*):?\s*[^\.!\n]+",
-		text,
-		re.IGNORECASE,
-	)
-	if m:
-		return m.group(0).strip(" .")
+	if "\n" in text or has_mismatches:
+		# the pattern's \s* can carry a phrase across a line break, and a few characters
+		# case-fold differently from str.lower(); leave those texts to the full pattern
+		m = _SALARY_EXP_RE.search(text)
+		fragment = m.group(0) if m else None
+	else:
+		fragment = _find_salary_fragment(text, text_lower)
+	if fragment is not None:
+		return fragment.strip(" .")
 
 	# Look for a money range or value with currency symbol or period indicator (more strict)
-	m2 = re.search(
-		r"[\$€£]\s?\d[\d,]*(?:\.\d+)?k?(?:\s*[-–]\s*[\$€£]?\s?\d[\d,]*(?:\.\d+)?k?)?(?:\s*(?:USD|GBP|EUR))?(?:\s*(?:per\s*(?:hour|day|week|month|year)|/hr|/hour|/day|/week|/month|/year|hr|hourly))?",
-		text,
-		re.IGNORECASE,
-	)
+	m2 = _MONEY_RE.search(text)
 	if m2:
 		return m2.group(0).strip(" .")
 
 	# Look for numbers with explicit period indicators (per hour/day/week/month/year)
-	m3 = re.search(
-		r"\d+[\d,]*(?:\.\d+)?k?\s*(?:per\s*(?:hour|day|week|month|year)|/hr|/hour|/day|/week|/month|/year|hr\b|hourly|daily|weekly|monthly|yearly)",
-		text,
-		re.IGNORECASE,
-	)
+	m3 = _NUM_PERIOD_RE.search(text)
 	if m3:
 		return m3.group(0).strip(" .")
 
 	# Handle textual descriptors like "Competitive"
-	m4 = re.search(r"\b(competitive|doe)\b", text, re.IGNORECASE)
+	m4 = _DESCRIPTOR_RE.search(text)
 	if m4:
 		return m4.group(1)
 
@@ -117,8 +294,26 @@ def extract_salary_phrase(s: str) -> str:
 	return ""
 
 
+def _num_from_token(tok: str) -> Optional[float]:
+	"""Parse a numeric salary token, normalising the k suffix (e.g., 50k -> 50000)."""
+	tok = tok.replace(',', '').strip()
+	m = _NUM_PARSE_RE.match(tok)
+	if not m:
+		return None
+	val = float(m.group(1))
+	if m.group(2):
+		val *= 1000
+	return val
+
+
 def parse_salary(s: Optional[str]) -> Dict[str, Any]:
 	"""Parse salary text into structured fields for display and filtering."""
+	# copy so callers can't mutate the cached result
+	return dict(_parse_salary(s))
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _parse_salary(s: Optional[str]) -> Dict[str, Any]:
 	out: Dict[str, Any] = {
 		"display": None,
 		"min_amount": None,
@@ -129,8 +324,8 @@ def parse_salary(s: Optional[str]) -> Dict[str, Any]:
 	}
 	if not s:
 		return out
-	orig = s.strip()
-	snippet = extract_salary_phrase(orig)
+	# extract_salary_phrase strips (and, for long texts, lowercases) the input itself
+	snippet = extract_salary_phrase(s)
 	
 	# If extract_salary_phrase returns empty, no clear salary found - return all nulls
 	if not snippet:
@@ -139,71 +334,48 @@ def parse_salary(s: Optional[str]) -> Dict[str, Any]:
 	text_lower = snippet.lower()
 
 	# Check for clear salary indicators - require at least one of: currency, period, or salary keywords
-	has_currency = bool(re.search(r"(\$|€|£|usd|gbp|eur)", snippet, re.IGNORECASE))
-	has_period = bool(re.search(r"(per\s*(?:hour|day|week|month|year)|/hr|/hour|/day|/week|/month|/year|hr\b|hourly|daily|weekly|monthly|yearly|annum|annual|\byr\b|\bpa\b)", text_lower))
-	has_salary_keywords = bool(re.search(r"\b(salary|compensation|package|rate|pay|wage|remuneration|base|bonus)\b", text_lower))
-
-	if not (has_currency or has_period or has_salary_keywords):
+	if not _SALARY_INDICATOR_RE.search(text_lower) and not (
+		# currency codes are matched case-insensitively, which str.lower() can't fully mirror
+		any(c in snippet for c in _LOWER_MISMATCHES) and _CURRENCY_RE.search(snippet)
+	):
 		return out
 
 	out["display"] = snippet
 
 	# currency (normalized to 3-letter codes) + symbol
-	cur_match = re.search(r"(\$|€|£|usd|gbp|eur)", snippet, re.IGNORECASE)
+	cur_match = _CURRENCY_RE.search(snippet)
 	if cur_match:
-		cur_raw = cur_match.group(1).lower()
-		if cur_raw in ("$", "usd"):
-			out["currency_code"] = "USD"
-			out["currency_symbol"] = "$"
-		elif cur_raw in ("£", "gbp"):
-			out["currency_code"] = "GBP"
-			out["currency_symbol"] = "£"
-		elif cur_raw in ("€", "eur"):
-			out["currency_code"] = "EUR"
-			out["currency_symbol"] = "€"
+		code_sym = _CUR_TABLE.get(cur_match.group(1).lower())
+		if code_sym:
+			out["currency_code"], out["currency_symbol"] = code_sym
 
 	# period (hour/day/week/month/year)
-	period: Optional[str] = None
-	if re.search(r"(per\s*hour|/hour|/hr|\shr\b|hourly)", text_lower):
-		period = "hour"
-	elif re.search(r"(per\s*day|/day|daily|day rate|daily rate)", text_lower):
-		period = "day"
-	elif re.search(r"(per\s*week|/week|weekly)", text_lower):
-		period = "week"
-	elif re.search(r"(per\s*month|/month|monthly|/mo\b)", text_lower):
-		period = "month"
-	elif re.search(r"(per\s*year|/year|annum|annual|yearly|\byr\b|\bpa\b|\bsalary\b|\bbase\b)", text_lower):
-		period = "year"
+	found_periods = {m.lastgroup for m in _PERIOD_ALT_RE.finditer(text_lower)}
+	period: Optional[str] = next((p for p in _PERIOD_PRIORITY if p in found_periods), None)
 	# Heuristic: ranges or single values in thousands, with no explicit shorter unit, are likely yearly
-	if not period and re.search(r"\d+\s*k\b", text_lower):
+	if not period and _THOUSANDS_RE.search(text_lower):
 		period = "year"
 	out["period"] = period
 
-	# normalize k suffix (e.g., 50k -> 50000)
-	def _num_from_token(tok: str) -> Optional[float]:
-		tok = tok.replace(',', '').strip()
-		m = re.match(r"^(\d+(?:\.\d+)?)(k)?$", tok, re.IGNORECASE)
-		if not m:
-			return None
-		val = float(m.group(1))
-		if m.group(2):
-			val *= 1000
-		return val
-
-	# find numeric tokens
-	tokens = re.findall(r"\d+[\d,]*(?:\.\d+)?k?", snippet, re.IGNORECASE)
-	nums = [_num_from_token(t) for t in tokens]
-	nums = [n for n in nums if n is not None]
-	if len(nums) == 1:
-		out["min_amount"] = out["max_amount"] = int(nums[0])
-	elif len(nums) >= 2:
-		out["min_amount"] = int(min(nums))
-		out["max_amount"] = int(max(nums))
+	# find numeric tokens, tracking min/max in a single pass
+	lo: Optional[float] = None
+	hi: Optional[float] = None
+	for m_num in _NUM_TOKEN_RE.finditer(snippet):
+		val = _num_from_token(m_num.group(0))
+		if val is None:
+			continue
+		if lo is None or val < lo:
+			lo = val
+		if hi is None or val > hi:
+			hi = val
+	if lo is not None:
+		out["min_amount"] = int(lo)
+		out["max_amount"] = int(hi)
 
 	# Refine display to drop leading labels like "Daily rate:" or "Compensation:"
 	if out["display"]:
 		raw_txt = out["display"].strip()
-		m_lead = re.search(r"[\$€£]|\d", raw_txt)
+		m_lead = _AMOUNT_LEAD_RE.search(raw_txt)
 		if m_lead and m_lead.start() > 0:
 			raw_txt = raw_txt[m_lead.start() :].lstrip()
 		# If display becomes empty after refinement, set to None
@@ -220,33 +392,49 @@ def parse_salary(s: Optional[str]) -> Dict[str, Any]:
 
 	# Normalise period capitalisation (e.g. "year" -> "Year")
 	if out["period"] is not None:
-		out["period"] = str(out["period"]).capitalize()
+		out["period"] = _PERIOD_LABELS[out["period"]]
 
 	return out
 
 
+def _decode_entities(text: str) -> str:
+	"""Decode HTML entities and turn the resulting ampersands into spaces."""
+	# Job board HTML is mostly "&amp;" and "&nbsp;"; when those are the only entities,
+	# two replaces give the same result as html.unescape at a fraction of the cost
+	if text.count("&") == text.count("&amp;") + text.count("&nbsp;"):
+		return text.replace("&nbsp;", "\xa0").replace("&amp;", " ")
+	# Decode HTML entities, then replace standalone ampersands with a space
+	return html.unescape(text).replace("&", " ")
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
 def clean_html_description(s: Optional[str]) -> str:
 	if not s:
 		return ""
-	# Strip HTML tags
-	text = re.sub(r"<[^>]+>", " ", s)
-	# Decode HTML entities
-	text = html.unescape(text)
-	# Replace standalone ampersands with a space
-	text = text.replace("&", " ")
+	# Strip HTML tags (plain-text descriptions skip the regex entirely)
+	text = _TAG_RE.sub(" ", s) if "<" in s else s
+	if "&" in text:
+		text = _decode_entities(text)
 	# Normalise whitespace
-	text = re.sub(r"\s+", " ", text)
+	text = _WS_RE.sub(" ", text)
 	return text.strip()
 
 
-def parse_posted_date(s: Optional[str]) -> Optional[str]:
+def parse_posted_date(s: Optional[str], today: Optional[date] = None) -> Optional[str]:
 	if not s:
 		return None
 	text = s.strip()
 	if not text:
 		return None
 
-	# First try standard absolute date formats
+	# ISO dates are the common case; date.fromisoformat avoids the strptime attempts
+	if len(text) == 10 and text[4] == "-" and text[7] == "-":
+		try:
+			return date.fromisoformat(text).isoformat()
+		except ValueError:
+			pass
+
+	# Then try standard absolute date formats
 	for fmt in ("%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y"):
 		try:
 			d = datetime.strptime(text, fmt).date()
@@ -255,7 +443,8 @@ def parse_posted_date(s: Optional[str]) -> Optional[str]:
 			pass
 
 	lower = text.lower()
-	today = datetime.today().date()
+	if today is None:
+		today = datetime.today().date()
 
 	# Relative phrases
 	if lower in ("today", "just now"):
@@ -263,97 +452,227 @@ def parse_posted_date(s: Optional[str]) -> Optional[str]:
 	if lower == "yesterday":
 		return (today - timedelta(days=1)).isoformat()
 
-	m = re.match(r"^\s*(\d+)\s+day[s]?\s+ago\s*$", lower)
+	# "2 days ago", "3 weeks ago", "1 year ago", ...
+	m = _REL_DATE_RE.match(lower)
 	if m:
-		days = int(m.group(1))
+		days = int(m.group(1)) * _REL_UNIT_DAYS[m.group(2)]
 		return (today - timedelta(days=days)).isoformat()
 
-	m = re.match(r"^\s*(\d+)\s+week[s]?\s+ago\s*$", lower)
-	if m:
-		weeks = int(m.group(1))
-		return (today - timedelta(days=7 * weeks)).isoformat()
-
-	m = re.match(r"^\s*(\d+)\s+month[s]?\s+ago\s*$", lower)
-	if m:
-		months = int(m.group(1))
-		# Approximate a month as 30 days
-		return (today - timedelta(days=30 * months)).isoformat()
-
-	m = re.match(r"^\s*(\d+)\s+year[s]?\s+ago\s*$", lower)
-	if m:
-		years = int(m.group(1))
-		return (today - timedelta(days=365 * years)).isoformat()
-
 	# Things like "3 hours ago", "45 minutes ago" -> treat as today
-	if re.search(r"\bhour[s]?\s+ago\b", lower) or re.search(r"\bminute[s]?\s+ago\b", lower):
+	if _REL_NOW_RE.search(lower):
 		return today.isoformat()
 
 	# If nothing matches, treat as invalid and return None
 	return None
 
 
-def row_to_job(row: Dict[str, str], mapping: Dict[str, str]) -> Dict[str, Any]:
+def column_indices(fieldnames: List[str], mapping: Dict[str, str]) -> Dict[str, int]:
+	"""Resolve mapped header names to column positions once per file."""
+	# later duplicates win, matching csv.DictReader
+	positions = {h: i for i, h in enumerate(fieldnames)}
+	return {key: positions[h] for key, h in mapping.items()}
+
+
+def get_field(row: List[str], idx: Dict[str, int], key: str) -> str:
+	i = idx.get(key)
+	if i is None or i >= len(row):
+		return ""
+	return row[i]
+
+
+def is_placeholder_location(location: str) -> bool:
+	if any(c in location for c in _LOWER_MISMATCHES):
+		# str.lower() doesn't fold these the way IGNORECASE does; use the full pattern
+		return _PLACEHOLDER_LOC_RE.fullmatch(location) is not None
+	return " ".join(location.lower().split()) in _PLACEHOLDER_LOCS
+
+
+def original_row(fieldnames: List[str], row: List[str]) -> Dict[Optional[str], Any]:
+	"""Rebuild the csv.DictReader view of a row, keeping extra fields under the None key."""
+	d: Dict[Optional[str], Any] = dict(zip(fieldnames, row))
+	if len(row) > len(fieldnames):
+		d[None] = row[len(fieldnames) :]
+	else:
+		for key in fieldnames[len(row) :]:
+			d[key] = None
+	return d
+
+
+def row_to_job(
+	row: List[str],
+	idx: Dict[str, int],
+	fieldnames: List[str],
+	keep_original: bool = False,
+	today: Optional[date] = None,
+) -> Dict[str, Any]:
 	job = {}
-	job["job_title"] = row.get(mapping.get("job_title", ""), "").strip()
-	location_raw = row.get(mapping.get("location", ""), "").strip()
-	posted_raw = row.get(mapping.get("posted_date", ""), "").strip()
-	job["job_url"] = row.get(mapping.get("job_url", ""), "").strip() or None
+	job["job_title"] = get_field(row, idx, "job_title").strip()
+	location_raw = get_field(row, idx, "location").strip()
+	posted_raw = get_field(row, idx, "posted_date").strip()
+	job["job_url"] = get_field(row, idx, "job_url").strip() or None
 	# Normalise posted date into ISO YYYY-MM-DD if possible
-	job["posted_date"] = parse_posted_date(posted_raw)
-	desc_html = row.get(mapping.get("job_description_html", ""), "")
+	job["posted_date"] = parse_posted_date(posted_raw, today)
+	desc_html = get_field(row, idx, "job_description_html")
 	job["job_description"] = clean_html_description(desc_html)
 
 	# Normalise obviously invalid/placeholder locations to null
-	if not location_raw or re.fullmatch(
-		r"(?i)\s*(see\s+job\s+desc\.?|see\s+job\s+description\.?|n/?a|na)\s*", location_raw
-	):
+	if not location_raw or is_placeholder_location(location_raw):
 		location_value: Optional[str] = None
 	else:
 		location_value = location_raw
 
 	job["location"] = location_value
 	# Use explicit salary column if present and not just "Competitive", otherwise infer from description
-	salary_raw = row.get(mapping.get("salary", ""), "").strip()
-	if salary_raw and not re.search(r"\bcompetitive\b", salary_raw, re.IGNORECASE):
+	salary_raw = get_field(row, idx, "salary").strip()
+	if salary_raw and not _COMPETITIVE_RE.search(salary_raw):
 		salary_source = salary_raw
 	else:
 		salary_source = job["job_description"]
 	job["salary"] = parse_salary(salary_source)
 	# Prefer explicit tech/skills column if present, otherwise derive from description
-	tech_raw = row.get(mapping.get("tech_stack", ""), "").strip()
+	tech_raw = get_field(row, idx, "tech_stack").strip()
 	source_for_tech = tech_raw if tech_raw else job["job_description"]
 	job["tech_stack"] = parse_tech_stack(source_for_tech)
-	job["original_row"] = row
+	if keep_original:
+		job["original_row"] = original_row(fieldnames, row)
 	return job
 
 
-def convert_csv_to_json(inpath: str, outpath: str) -> None:
+def _process_chunk(
+	rows: List[List[str]], idx: Dict[str, int], fieldnames: List[str], keep_original: bool, today: date
+) -> List[Dict[str, Any]]:
+	return [row_to_job(row, idx, fieldnames, keep_original, today) for row in rows]
+
+
+def _iter_row_chunks(reader: Iterator[List[str]], idx: Dict[str, int]) -> Iterator[List[List[str]]]:
+	"""Yield de-duplicated rows in chunks of _CHUNK_SIZE."""
+	chunk: List[List[str]] = []
+	seen_urls = set()
+	for row in reader:
+		if not row:
+			# csv.reader yields blank lines as empty rows
+			continue
+		# Check for duplicates before parsing so repeated rows cost a single lookup
+		job_url = get_field(row, idx, "job_url").strip().lower()
+		if job_url:
+			if job_url in seen_urls:
+				# Skip duplicated entries by job_url
+				continue
+			seen_urls.add(job_url)
+		chunk.append(row)
+		if len(chunk) >= _CHUNK_SIZE:
+			yield chunk
+			chunk = []
+	if chunk:
+		yield chunk
+
+
+def _parse_chunks_parallel(
+	chunks: Iterable[List[List[str]]], process: Callable[[List[List[str]]], List[Dict[str, Any]]]
+) -> Iterator[Dict[str, Any]]:
+	"""Parse chunks across processes, yielding jobs in input order."""
+	# row parsing is pure Python, so spread the chunks over processes to get past the GIL
+	max_pending = 2 * (os.cpu_count() or 1)
+	with ProcessPoolExecutor() as ex:
+		pending: deque = deque()
+		for chunk in chunks:
+			pending.append(ex.submit(process, chunk))
+			# only keep a few chunks in flight so memory stays flat on huge files
+			if len(pending) >= max_pending:
+				yield from pending.popleft().result()
+		while pending:
+			yield from pending.popleft().result()
+
+
+def _encode_job(job: Dict[str, Any]) -> bytes:
+	if orjson is not None:
+		try:
+			return orjson.dumps(job, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+		except TypeError:
+			# orjson rejects values the stdlib encoder accepts (e.g. integers beyond 64 bits)
+			pass
+	return json.dumps(job, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def write_json_array(fo: BinaryIO, jobs: Iterable[Dict[str, Any]]) -> None:
+	"""Stream jobs to fo as an indented JSON array, one element at a time."""
+	first = True
+	for job in jobs:
+		fo.write(b"[\n  " if first else b",\n  ")
+		# JSON strings never contain raw newlines, so this only re-indents the structure
+		fo.write(_encode_job(job).replace(b"\n", b"\n  "))
+		first = False
+	fo.write(b"[]" if first else b"\n]")
+
+
+def _convert_to_stream(inpath: str, fo: BinaryIO, keep_original: bool) -> None:
 	with open(inpath, newline='', encoding='utf-8') as f:
-		reader = csv.DictReader(f)
-		fieldnames = reader.fieldnames or []
+		reader = csv.reader(f)
+		fieldnames = next(reader, [])
 		mapping = map_columns(fieldnames)
-		jobs = []
-		seen_urls = set()
-		for row in reader:
-			job = row_to_job(row, mapping)
-			job_url = (job.get("job_url") or "").strip().lower()
-			if job_url:
-				if job_url in seen_urls:
-					# Skip duplicated entries by job_url
-					continue
-				seen_urls.add(job_url)
-			jobs.append(job)
-
-	with open(outpath, 'w', encoding='utf-8') as fo:
-		json.dump(jobs, fo, ensure_ascii=False, indent=2)
+		idx = column_indices(fieldnames, mapping)
+		# resolve "today" once so relative dates are consistent across the whole file
+		today = datetime.today().date()
+		process = functools.partial(
+			_process_chunk, idx=idx, fieldnames=fieldnames, keep_original=keep_original, today=today
+		)
+		chunks = _iter_row_chunks(reader, idx)
+		first = next(chunks, [])
+		second = next(chunks, None)
+		if second is None:
+			# everything fits in one chunk: not worth starting worker processes
+			write_json_array(fo, process(first))
+		else:
+			write_json_array(fo, _parse_chunks_parallel(itertools.chain([first, second], chunks), process))
+
+
+def convert_csv_to_json(inpath: str, outpath: str, keep_original: bool = False) -> None:
+	# Jobs are streamed out as they are parsed, so a regular output file is written via a temp file
+	# next to it and only replaced once the whole run succeeded; a failure leaves the old output intact.
+	# Anything else (devices like /dev/stdout, FIFOs) is written directly, as a plain open() would.
+	if os.path.exists(outpath) and not os.path.isfile(outpath):
+		with open(outpath, 'wb') as fo:
+			_convert_to_stream(inpath, fo, keep_original)
+		return
+
+	# resolve symlinks so the link is kept and the file it points to is updated
+	target = os.path.realpath(outpath)
+	try:
+		fd, tmp_path = tempfile.mkstemp(
+			dir=os.path.dirname(target), prefix=os.path.basename(target) + ".", suffix=".tmp"
+		)
+	except OSError:
+		# e.g. a writable file in a read-only directory: no temp file possible, write in place
+		with open(outpath, 'wb') as fo:
+			_convert_to_stream(inpath, fo, keep_original)
+		return
+
+	try:
+		with os.fdopen(fd, 'wb') as fo:
+			_convert_to_stream(inpath, fo, keep_original)
+		if os.path.exists(target):
+			shutil.copymode(target, tmp_path)
+		else:
+			# mkstemp creates the file as 0600; give it the permissions a plain open() would have
+			umask = os.umask(0)
+			os.umask(umask)
+			os.chmod(tmp_path, 0o666 & ~umask)
+		os.replace(tmp_path, target)
+	except BaseException:
+		try:
+			os.unlink(tmp_path)
+		except OSError:
+			pass
+		raise
 
 
 def main():
 	parser = argparse.ArgumentParser(description='Convert jobs CSV to structured JSON')
 	parser.add_argument('input_csv', help='Path to input CSV file')
 	parser.add_argument('output_json', nargs='?', default='jobs.json', help='Path to output JSON file (default: jobs.json)')
+	parser.add_argument('--keep-original', action='store_true', help='Include the raw CSV row as "original_row" in each job')
 	args = parser.parse_args()
-	convert_csv_to_json(args.input_csv, args.output_json)
+	convert_csv_to_json(args.input_csv, args.output_json, args.keep_original)
 	print(f'Wrote structured JSON to {args.output_json}')
 
 
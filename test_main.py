@@ -0,0 +1,105 @@
+import random
+import unittest
+
+import main
+
+
+def reference_extract_salary_phrase(s: str) -> str:
+	"""extract_salary_phrase as it was before the string-based shortcuts: the regexes alone."""
+	text = s.strip()
+	if not text:
+		return ""
+	if len(text) <= 120:
+		return text
+	for pattern in (main._SALARY_EXP_RE, main._MONEY_RE, main._NUM_PERIOD_RE):
+		m = pattern.search(text)
+		if m:
+			return m.group(0).strip(" .")
+	m = main._DESCRIPTOR_RE.search(text)
+	if m:
+		return m.group(1)
+	return ""
+
+
+FILLER = "We are looking for a skilled professional to join our team and build things. "
+
+
+class SalaryPhraseEquivalenceTest(unittest.TestCase):
+	"""The hand-written fast paths in extract_salary_phrase must agree with the original regexes."""
+
+	def assertMatchesReference(self, text: str) -> None:
+		self.assertEqual(main.extract_salary_phrase(text), reference_extract_salary_phrase(text), repr(text))
+
+	def test_prefilter_period_words(self):
+		for cue in ("500 daily", "500 weekly", "500 monthly", "500 yearly", "40 hourly", "40/hr", "40 hr", "90 per day"):
+			self.assertMatchesReference(FILLER * 2 + "Contractors are paid " + cue + ", flexible schedule.")
+
+	def test_prefilter_no_cues(self):
+		self.assertEqual(main.extract_salary_phrase(FILLER * 3), "")
+
+	def test_prefilter_case_folding_characters(self):
+		# IGNORECASE matches these to keyword letters, str.lower() does not
+		for text in (
+			"\u017falary: 50000 USD gross " + "x" * 120,
+			"Remunerat\u0131on 50k " + "y" * 120,
+			"Compet\u0130tive " + "z" * 120,
+		):
+			self.assertMatchesReference(text)
+
+
+	def test_fragment_terminator_adjacent_keywords(self):
+		for tail in (
+			"Salary. Pay: 50k per year.",
+			"rate! wage is 30/hr",
+			"package.",
+			"pay.! rate: $40 hourly!",
+			"Our remuneration",
+			"accurate. Compensation: $100k base + bonus.",
+		):
+			text = FILLER * 2 + tail
+			self.assertMatchesReference(text)
+			m = main._SALARY_EXP_RE.search(text)
+			self.assertEqual(main._find_salary_fragment(text, text.lower()), m.group(0) if m else None, repr(text))
+
+	def test_fragment_newlines(self):
+		# the pattern's \s* can carry a phrase onto the next line
+		for tail in ("Salary\n 50k per year", "Pay:\n\n. 40/hr", "rate\n.\nwage 30 daily", "Salary:\r\n$90k"):
+			self.assertMatchesReference(FILLER * 2 + tail)
+
+	def test_fragment_case_folding_characters(self):
+		for tail in ("\u017falary: 50k", "remunerat\u0131on 30 weekly", "\u0130 pay 40/hr", "RATE \u0130: 500 daily."):
+			self.assertMatchesReference(FILLER * 2 + tail)
+
+	def test_random_texts(self):
+		atoms = [
+			"salary", "Salary", "PAY", "rate", "package", "wage", "remuneration", "compensation",
+			".", "!", "\n", "\r", " ", ":", "$", "50k", "120", "/hr", "per hour", "daily", "weekly",
+			"competitive", "doe", "pa", "yment", "rat", "e", "x", "abc def ", "\u017f", "\u0130", "\u0131",
+		]
+		rng = random.Random(0)
+		for _ in range(5000):
+			text = FILLER * 2 + "".join(rng.choice(atoms) for _ in range(rng.randint(1, 40)))
+			self.assertMatchesReference(text)
+
+
+class ParseSalaryTest(unittest.TestCase):
+	def test_currency_code_matched_case_insensitively(self):
+		# "\u017f" (long s) matches "s" under IGNORECASE, so this still counts as a currency
+		out = main.parse_salary("100 u\u017fd")
+		self.assertEqual((out["min_amount"], out["max_amount"]), (100, 100))
+		out = main.parse_salary(FILLER * 2 + "Rate: 50k u\u017fd, plus benefits.")
+		self.assertEqual((out["min_amount"], out["period"]), (50000, "Year"))
+
+
+class PlaceholderLocationTest(unittest.TestCase):
+	def test_matches_original_pattern(self):
+		for loc in (
+			"See Job Desc.", "see  job\tdescription", "N/A", "na", "n/a.", "n / a", "Berlin",
+			"\u017fee job desc", "See job descr\u0130ption", "See job descr\u0131ption.",
+		):
+			expected = main._PLACEHOLDER_LOC_RE.fullmatch(loc) is not None
+			self.assertEqual(main.is_placeholder_location(loc), expected, repr(loc))
+
+
+if __name__ == "__main__":
+	unittest.main()